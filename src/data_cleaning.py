@@ -1,9 +1,49 @@
 import re
 import string
+from functools import lru_cache
+from itertools import chain
 from typing import List, Union
+import joblib
+import numpy as np
 import pandas as pd
 
 
+# Patterns used by clean_financial_text, compiled once at import time.
+# Numbers are written as \d+(?:[,.]\d*)? so a run of digits can only be
+# split one way, which keeps backtracking on long digit runs bounded.
+_RE_HTML = re.compile(r'<.*?>')
+_RE_URL = re.compile(r'http\S+|www\S+')
+_RE_SEE = re.compile(r'see,? for starters at least,?', re.IGNORECASE)
+_RE_US = re.compile(r"\bU\.S\.\b")
+_RE_CHECK = re.compile(r'check[- ]cashing', re.IGNORECASE)
+_RE_WS = re.compile(r'\s+')
+
+# Currency amounts are the only rewrites that need a Python callback, so they
+# share one alternation dispatched on the name of the matched branch. The
+# leading lookahead lets the regex engine skip ahead to digits and symbols.
+_RE_CURRENCY = re.compile(
+    r'(?=[\d$€£])(?:'
+    r'(?P<rng>(?P<rng_lo>\d+(?:[,.]\d*)?)[-–](?P<rng_hi>\d+(?:[,.]\d*)?)\s*(?P<rng_unit>[KkMmBb])\b)'
+    r'|(?P<symu>(?P<symu_sym>[$€£])\s*(?P<symu_num>\d+(?:[,.]\d*)?)\s*(?P<symu_unit>[KkMmBb])\b)'
+    r'|(?P<sym>(?P<sym_sym>[$€£])\s*(?P<sym_num>\d+(?:[,.]\d*)?)\b)'
+    r')'
+)
+
+# Unwanted characters, removed with str.translate
+_STRIP_TABLE = str.maketrans('', '', '|ǀ│\'"—().-')
+
+# Number with an optional K/M/B unit, and the multiplier for each unit
+_AMT_RE = re.compile(r'(?P<num>\d+(?:[,.]\d*)?)\s*(?P<unit>[KMB])?')
+_MULT = {'K': 1_000, 'M': 1_000_000, 'B': 1_000_000_000}
+
+# Currency symbol -> ISO code
+_SYMBOL_MAP = {'$': 'USD', '€': 'EUR', '£': 'GBP'}
+
+# Columns with more distinct values than this are cleaned in parallel
+# worker processes
+_PARALLEL_MIN_VALUES = 50_000
+
+
 def normalize_currency_amount(match) -> str:
     """Normalize individual currency amounts"""
     # Different patterns will have different group structures
@@ -92,69 +132,98 @@ def normalize_single_amount(amount_str: str) -> str:
     amount_str = amount_str.upper()
 
     # Extract number and unit
-    num_match = re.search(r'(\\d+[,.]?\\d*)', amount_str)
-    unit_match = re.search(r'([KMB])', amount_str)
-
-    if not num_match:
+    match = _AMT_RE.search(amount_str)
+    if not match:
         return amount_str
 
-    amount = float(num_match.group(1).replace(",", ""))
-
-    if unit_match:
-        unit = unit_match.group(1)
-        if unit == "K":
-            amount *= 1000
-        elif unit == "M":
-            amount *= 1_000_000
-        elif unit == "B":
-            amount *= 1_000_000_000
+    amount = float(match['num'].replace(",", "")) * _MULT.get(match['unit'], 1)
 
-    return str(int(amount))
+    return str(round(amount))
 
 
 def get_currency_code(symbol: str) -> str:
     """Map currency symbol to code"""
-    symbol_map = {'$': 'USD', '€': 'EUR', '£': 'GBP'}
-    return symbol_map.get(symbol, 'USD')
+    return _SYMBOL_MAP.get(symbol, 'USD')
+
+
+def _replace_range(match) -> str:
+    """Handle ranges with units (5K–10K, 1M–2M)"""
+    mult = _MULT[match.group('rng_unit').upper()]
+    low = round(float(match.group('rng_lo').replace(',', '')) * mult)
+    high = round(float(match.group('rng_hi').replace(',', '')) * mult)
+    return f"{low}–{high}"
+
+
+def _replace_symbol_unit_amount(match) -> str:
+    """Handle amounts with units ($5K, €2.5M)"""
+    amount = round(float(match.group('symu_num').replace(',', '')) * _MULT[match.group('symu_unit').upper()])
+    return f"{amount} {_SYMBOL_MAP.get(match.group('symu_sym'), 'USD')}"
+
+
+def _replace_symbol_amount(match) -> str:
+    """Handle simple amounts with symbols ($100, €50)"""
+    return f"{match.group('sym_num').replace(',', '')} {_SYMBOL_MAP.get(match.group('sym_sym'), 'USD')}"
+
+
+# Replacement for each named branch of _RE_CURRENCY
+_HANDLERS = {
+    'rng': _replace_range,
+    'symu': _replace_symbol_unit_amount,
+    'sym': _replace_symbol_amount,
+}
+
+
+@lru_cache(maxsize=131072)
+def _clean_text(text: str) -> str:
+    """Clean a single string (memoized body of clean_financial_text)"""
+    # Collapse whitespace first: the HTML and phrase patterns below expect
+    # single spaces and do not match across line breaks
+    text = _RE_WS.sub(' ', text)
+
+    # 1) Remove HTML, URLs and specific phrases
+    text = _RE_HTML.sub('', text)
+    text = _RE_URL.sub(' ', text)
+    text = _RE_SEE.sub('', text)
+
+    # 2) Standardize abbreviations
+    text = _RE_US.sub("US", text)
+    text = _RE_CHECK.sub('check cashing', text)
+
+    # 3) Normalize currency amounts, and remove unwanted characters from the
+    #    text between them (the set includes '.' and '-', which amounts use)
+    parts = []
+    last = 0
+    for match in _RE_CURRENCY.finditer(text):
+        parts.append(text[last:match.start()].translate(_STRIP_TABLE))
+        parts.append(_HANDLERS[match.lastgroup](match))
+        last = match.end()
+    parts.append(text[last:].translate(_STRIP_TABLE))
+
+    # 4) Clean whitespace left by the removals
+    return _RE_WS.sub(' ', ''.join(parts)).strip()
 
 
 def clean_financial_text(text: str) -> str:
     """
     Comprehensive financial text cleaning and normalization
+
+    Results are memoized; call clean_financial_text.cache_clear() to free them
     """
-    if not isinstance(text, str):
+    if not isinstance(text, str) or not text:
         return text
 
-    # 1) Remove unwanted characters and HTML
-    text = re.sub(r'[|\\ǀ│\'"|—().-]', '', text)
-    text = re.sub(r'<.*?>', '', text)
-
-    # 2) Remove URLs and specific phrases
-    text = re.sub(r'http\\S+|www\\S+', ' ', text)
-    text = re.sub(r'see,? for starters at least,?', '', text, flags=re.IGNORECASE)
-
-    # 3) Standardize abbreviations
-    text = re.sub(r"\\bU\\.S\\.\\b", "US", text)
-    text = re.sub(r'check[- ]cashing', 'check cashing', text, flags=re.IGNORECASE)
-
-    # 4) Normalize currency patterns - SIMPLIFIED version
-
-    # Handle ranges with units (5K-10K, 1M-2M)
-    text = re.sub(r'(\\d+[,.]?\\d*)[-–](\\d+[,.]?\\d*)\\s*([KkMmBb])\\b',
-                 lambda m: f"{normalize_single_amount(m.group(1) + m.group(3))}–{normalize_single_amount(m.group(2) + m.group(3))}", text)
+    return _clean_text(text)
 
-    # Handle simple amounts with symbols ($100, €50)
-    text = re.sub(r'([$€£])\\s*(\\d+[,.]?\\d*)\\b',
-                 lambda m: f"{m.group(2).replace(',', '')} {get_currency_code(m.group(1))}", text)
 
-    # Handle amounts with units ($5K, €2.5M)
-    text = re.sub(r'([$€£])\\s*(\\d+[,.]?\\d*)\\s*([KkMmBb])\\b',
-                 lambda m: normalize_single_amount(m.group(2) + m.group(3) + " " + get_currency_code(m.group(1))), text)
+clean_financial_text.cache_clear = _clean_text.cache_clear
 
-    # 6) Clean whitespace
-    text = re.sub(r'\\s+', ' ', text).strip()
 
-    return text
+def _clean_chunk(values) -> List[str]:
+    """Clean one chunk of a column (module level so joblib workers can load it)"""
+    # Values are already distinct, so skip the cache rather than fill it
+    # in every worker process; non-str values (missing ones) pass through
+    clean = _clean_text.__wrapped__
+    return [clean(value) if isinstance(value, str) and value else value for value in values]
 
 
 def normalize_dataframe_text(df: pd.DataFrame, text_columns: List[str]) -> pd.DataFrame:
@@ -163,9 +232,21 @@ def normalize_dataframe_text(df: pd.DataFrame, text_columns: List[str]) -> pd.Da
     """
     for col in text_columns:
         if col in df.columns:
-            # Basic cleaning first
-            df[col] = df[col].astype(str).str.strip().str.replace("\\s+", " ", regex=True)
-            # Then apply financial normalization
-            df[col] = df[col].apply(clean_financial_text)
+            # The cleaning below already collapses and strips whitespace
+            s = df[col].astype(str)
+            # Questions and boilerplate answers repeat, so clean each
+            # distinct value once and map the results back onto the rows
+            uniq = pd.Series(s.unique())
+            if len(uniq) > _PARALLEL_MIN_VALUES:
+                # Values are independent, so split them across all cores
+                chunks = np.array_split(uniq.to_numpy(), joblib.cpu_count())
+                cleaned = joblib.Parallel(n_jobs=-1)(
+                    joblib.delayed(_clean_chunk)(chunk) for chunk in chunks)
+                cleaned = list(chain.from_iterable(cleaned))
+            else:
+                cleaned = _clean_chunk(uniq)
+            # Arrow-backed strings keep the column in one contiguous buffer
+            # and run later .str operations in C++
+            df[col] = s.map(dict(zip(uniq, cleaned))).astype('string[pyarrow]')
 
     return df
\ No newline at end of file
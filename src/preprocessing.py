@@ -1,12 +1,47 @@
 import nltk
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
 from nltk.stem import WordNetLemmatizer
-from nltk import pos_tag
+from nltk.tag import PerceptronTagger
+import math
 import re
 import string
 from typing import List, Tuple
+import numpy as np
 import pandas as pd
+import plotly.graph_objects as go
+
+
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]+")
+
+# Penn Treebank tag prefix -> WordNet POS; anything else is treated as a noun
+_WORDNET_POS = {'J': 'a', 'V': 'v', 'N': 'n', 'R': 'r'}
+
+# Built on first use so the module can be imported before the NLTK data
+# has been downloaded
+_STOPWORDS = None
+_LEMMATIZER = None
+_TAGGER = None
+
+
+def _get_stopwords() -> frozenset:
+    """Return the cached English stopword set, loading it if needed"""
+    global _STOPWORDS
+    if _STOPWORDS is None:
+        _STOPWORDS = frozenset(stopwords.words('english'))
+    return _STOPWORDS
+
+
+def _get_lemmatizer_and_tagger() -> Tuple[WordNetLemmatizer, PerceptronTagger]:
+    """Return the cached lemmatizer and POS tagger, loading them if needed"""
+    global _LEMMATIZER, _TAGGER
+    if _TAGGER is None:
+        # Assign only once both have loaded, so a missing resource is
+        # retried on the next call instead of leaving a half-built cache
+        lemmatizer = WordNetLemmatizer()
+        tagger = PerceptronTagger()
+        _LEMMATIZER, _TAGGER = lemmatizer, tagger
+    return _LEMMATIZER, _TAGGER
 
 
 def download_nltk_resources():
@@ -19,6 +54,60 @@ def download_nltk_resources():
     nltk.download('averaged_perceptron_tagger_eng')
 
 
+def preprocess_texts(texts: List[str], 
+                    remove_stopwords: bool = True,
+                    lemmatize: bool = True,
+                    remove_punctuation: bool = True) -> List[str]:
+    """
+    Preprocess a batch of texts with various NLP techniques
+    
+    Parameters:
+    -----------
+    texts : List[str]
+        Input texts to preprocess
+    remove_stopwords : bool
+        Whether to remove stopwords
+    lemmatize : bool
+        Whether to lemmatize words
+    remove_punctuation : bool
+        Whether to remove punctuation
+    
+    Returns:
+    --------
+    List[str]
+        Preprocessed texts, in the same order as the input
+    """
+    stop_words = _get_stopwords() if remove_stopwords else frozenset()
+    
+    token_lists = []
+    for text in texts:
+        # Convert to lowercase
+        text = text.lower()
+        
+        # Remove punctuation
+        if remove_punctuation:
+            text = text.translate(_PUNCT_TABLE)
+        
+        # Tokenize
+        tokens = _TOKEN_RE.findall(text)
+        
+        # Remove stopwords
+        if remove_stopwords:
+            tokens = [token for token in tokens if token not in stop_words]
+        
+        token_lists.append(tokens)
+    
+    # Lemmatize, using POS tags from a single pass of the cached tagger
+    if lemmatize:
+        lemmatizer, tagger = _get_lemmatizer_and_tagger()
+        token_lists = [
+            [lemmatizer.lemmatize(word, _WORDNET_POS.get(tag[:1], 'n')) for word, tag in tagged]
+            for tagged in tagger.tag_sents(token_lists)
+        ]
+    
+    return [' '.join(tokens) for tokens in token_lists]
+
+
 def preprocess_text(text: str, 
                    remove_stopwords: bool = True,
                    lemmatize: bool = True,
@@ -42,41 +131,48 @@ def preprocess_text(text: str,
     str
         Preprocessed text
     """
-    # Convert to lowercase
-    text = text.lower()
-    
-    # Remove punctuation
-    if remove_punctuation:
-        text = text.translate(str.maketrans('', '', string.punctuation))
-    
-    # Tokenize
-    tokens = word_tokenize(text)
-    
-    # Remove stopwords
-    if remove_stopwords:
-        stop_words = set(stopwords.words('english'))
-        tokens = [token for token in tokens if token not in stop_words]
-    
-    # Lemmatize
-    if lemmatize:
-        lemmatizer = WordNetLemmatizer()
-        # Get POS tags for better lemmatization
-        pos_tags = pos_tag(tokens)
-        tokens = []
-        for word, tag in pos_tags:
-            if tag.startswith('J'):  # Adjective
-                pos = 'a'
-            elif tag.startswith('V'):  # Verb
-                pos = 'v'
-            elif tag.startswith('N'):  # Noun
-                pos = 'n'
-            elif tag.startswith('R'):  # Adverb
-                pos = 'r'
-            else:
-                pos = 'n'  # Default to noun
-            tokens.append(lemmatizer.lemmatize(word, pos))
-    
-    return ' '.join(tokens)
+    return preprocess_texts([text], remove_stopwords, lemmatize, remove_punctuation)[0]
+
+
+# Currency patterns
+_CURRENCY_PATTERNS = [
+    (r'\$\s*\d[\d,.]*\s*[KkMmBb]?\b', 'CURRENCY'),
+    (r'\d[\d,.]*\s*[KkMmBb]?\s*(USD|EUR|GBP|CAD|AUD|JPY)\b', 'CURRENCY'),
+    (r'€\s*\d[\d,.]*\s*[KkMmBb]?\b', 'CURRENCY'),
+    (r'£\s*\d[\d,.]*\s*[KkMmBb]?\b', 'CURRENCY')
+]
+
+# Financial instrument keywords
+_INSTRUMENT_KEYWORDS = [
+    (('stock', 'stocks', 'equity', 'equities'), 'INSTRUMENT'),
+    (('bond', 'bonds', 'treasury', 'municipal'), 'INSTRUMENT'),
+    (('option', 'options', 'put', 'call', 'derivative'), 'INSTRUMENT'),
+    (('etf', 'mutual fund', 'index fund'), 'INSTRUMENT'),
+    (('ira', '401k', 'roth', 'traditional'), 'RETIREMENT_ACCOUNT')
+]
+
+# Financial term keywords
+_TERM_KEYWORDS = [
+    (('dividend', 'dividends'), 'FINANCIAL_TERM'),
+    (('interest', 'rate', 'apr', 'apy'), 'FINANCIAL_TERM'),
+    (('tax', 'taxes', 'deduction', 'credit'), 'FINANCIAL_TERM'),
+    (('invest', 'investment', 'portfolio'), 'FINANCIAL_TERM'),
+    (('loan', 'mortgage', 'refinance'), 'FINANCIAL_TERM')
+]
+
+# Lowercased keyword -> entity type
+_KEYWORD_TYPES = {keyword: entity_type
+                  for keywords, entity_type in _INSTRUMENT_KEYWORDS + _TERM_KEYWORDS
+                  for keyword in keywords}
+
+# One scan of the text: currency patterns first, then whole words (or a
+# multi-word keyword) that are looked up in _KEYWORD_TYPES
+_PHRASE_KEYWORDS = '|'.join(re.escape(keyword) for keyword in _KEYWORD_TYPES if ' ' in keyword)
+_ENTITY_RE = re.compile(
+    '(?P<CURRENCY>' + '|'.join(pattern for pattern, _ in _CURRENCY_PATTERNS) + ')'
+    + rf'|(?P<WORD>\b(?:{_PHRASE_KEYWORDS})\b|\w+)',
+    re.IGNORECASE
+)
 
 
 def extract_financial_entities(text: str) -> List[Tuple[str, str]]:
@@ -91,43 +187,17 @@ def extract_financial_entities(text: str) -> List[Tuple[str, str]]:
     Returns:
     --------
     List[Tuple[str, str]]
-        List of (entity, type) tuples
+        List of (entity, type) tuples, in order of appearance
     """
     entities = []
     
-    # Currency patterns
-    currency_patterns = [
-        (r'\\$\\s*\\d+[\\d,.]*\\s*[KkMmBb]?\\b', 'CURRENCY'),
-        (r'\\d+[\\d,.]*\\s*[KkMmBb]?\\s*(USD|EUR|GBP|CAD|AUD|JPY)\\b', 'CURRENCY'),
-        (r'\\€\\s*\\d+[\\d,.]*\\s*[KkMmBb]?\\b', 'CURRENCY'),
-        (r'\\£\\s*\\d+[\\d,.]*\\s*[KkMmBb]?\\b', 'CURRENCY')
-    ]
-    
-    # Financial instrument patterns
-    instrument_patterns = [
-        (r'\\b(stock|stocks|equity|equities)\\b', 'INSTRUMENT'),
-        (r'\\b(bond|bonds|treasury|municipal)\\b', 'INSTRUMENT'),
-        (r'\\b(option|options|put|call|derivative)\\b', 'INSTRUMENT'),
-        (r'\\b(ETF|etf|mutual fund|index fund)\\b', 'INSTRUMENT'),
-        (r'\\b(IRA|ira|401k|roth|traditional)\\b', 'RETIREMENT_ACCOUNT')
-    ]
-    
-    # Financial term patterns
-    term_patterns = [
-        (r'\\b(dividend|dividends)\\b', 'FINANCIAL_TERM'),
-        (r'\\b(interest|rate|APR|APY)\\b', 'FINANCIAL_TERM'),
-        (r'\\b(tax|taxes|deduction|credit)\\b', 'FINANCIAL_TERM'),
-        (r'\\b(invest|investment|portfolio)\\b', 'FINANCIAL_TERM'),
-        (r'\\b(loan|mortgage|refinance)\\b', 'FINANCIAL_TERM')
-    ]
-    
-    # Check all patterns
-    all_patterns = currency_patterns + instrument_patterns + term_patterns
-    
-    for pattern, entity_type in all_patterns:
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
-            entities.append((match.group(), entity_type))
+    for match in _ENTITY_RE.finditer(text):
+        if match.lastgroup == 'CURRENCY':
+            entities.append((match.group(), 'CURRENCY'))
+        else:
+            entity_type = _KEYWORD_TYPES.get(match.group().lower())
+            if entity_type is not None:
+                entities.append((match.group(), entity_type))
     
     return entities
 
@@ -156,20 +226,22 @@ def calculate_text_statistics(texts: List[str]) -> dict:
         'vocabulary_size': 0
     }
     
-    all_words = []
+    vocab = set()
+    total_word_length = 0
     for text in texts:
         words = text.split()
         stats['total_words'] += len(words)
         stats['total_characters'] += len(text)
-        all_words.extend(words)
+        total_word_length += sum(map(len, words))
+        vocab.update(words)
     
     if texts:
         stats['avg_words_per_text'] = stats['total_words'] / len(texts)
         stats['avg_chars_per_text'] = stats['total_characters'] / len(texts)
     
-    if all_words:
-        stats['avg_word_length'] = sum(len(word) for word in all_words) / len(all_words)
-        stats['vocabulary_size'] = len(set(all_words))
+    if stats['total_words']:
+        stats['avg_word_length'] = total_word_length / stats['total_words']
+        stats['vocabulary_size'] = len(vocab)
     
     return stats
 
@@ -190,12 +262,21 @@ def create_text_length_histogram(texts: List[str], title: str = "Text Length Dis
     go.Figure
         Plotly figure object
     """
-    text_lengths = [len(text.split()) for text in texts]
+    text_lengths = np.fromiter((len(text.split()) for text in texts),
+                               dtype=np.int32, count=len(texts))
+    
+    # Word counts are integers, so use whole-number bins (at most 50) that
+    # each cover the same number of distinct lengths
+    lo = int(text_lengths.min()) if text_lengths.size else 0
+    hi = int(text_lengths.max()) if text_lengths.size else 0
+    step = max(1, math.ceil((hi - lo + 1) / 50))
+    counts, edges = np.histogram(text_lengths, bins=np.arange(lo, hi + step + 1, step))
     
     fig = go.Figure()
-    fig.add_trace(go.Histogram(
-        x=text_lengths,
-        nbinsx=50,
+    fig.add_trace(go.Bar(
+        x=edges[:-1] + (step - 1) / 2,
+        y=counts,
+        width=step,
         marker_color='blue',
         opacity=0.7
     ))
@@ -7,6 +7,19 @@ from nltk.corpus import stopwords
 import nltk
 
 
+# Built on first use so the module can be imported before the NLTK data
+# has been downloaded
+_STOPWORDS_CACHED = None
+
+
+def _get_stopwords() -> frozenset:
+    """Return the cached English stopword set, loading it if needed"""
+    global _STOPWORDS_CACHED
+    if _STOPWORDS_CACHED is None:
+        _STOPWORDS_CACHED = frozenset(stopwords.words("english"))
+    return _STOPWORDS_CACHED
+
+
 def create_word_frequency_bar_chart(word_freq: Counter, top_n: int = 20, 
                                   title: str = "Top Words Frequency") -> go.Figure:
     """
@@ -66,21 +79,21 @@ def create_interactive_tag_cloud(word_freq: Counter, top_n: int = 80,
     """
     items = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:top_n]
     words, counts = zip(*items)
-    dfw = pd.DataFrame({"word": words, "count": counts})
+    counts_np = np.fromiter(counts, dtype=np.int64, count=len(counts))
     
-    sizes = np.interp(dfw["count"], (dfw["count"].min(), dfw["count"].max()), 
+    sizes = np.interp(counts_np, (counts_np.min(), counts_np.max()), 
                      (min_size, max_size))
     
     n_cols = 6
-    n_rows = int(np.ceil(len(dfw) / n_cols))
-    x = np.tile(np.arange(n_cols), n_rows)[:len(dfw)]
-    y = -np.repeat(np.arange(n_rows), n_cols)[:len(dfw)]
+    positions = np.arange(len(words))
+    x = positions % n_cols
+    y = -(positions // n_cols)
     
     fig = go.Figure(go.Scatter(
         x=x, y=y, mode="text",
-        text=dfw["word"],
+        text=list(words),
         textfont=dict(size=sizes),
-        hovertext=[f"{w}: {c}" for w, c in zip(dfw["word"], dfw["count"])],
+        hovertext=[f"{w}: {c}" for w, c in zip(words, counts)],
         hoverinfo="text"
     ))
     
@@ -111,15 +124,9 @@ def get_word_frequencies(texts: list, remove_stopwords: bool = True) -> Counter:
     Counter
         Word frequency counter
     """
-    stop_words = set(stopwords.words("english")) if remove_stopwords else set()
-    all_words = []
-    
-    for text in texts:
-        for word in text.split():
-            if word not in stop_words:
-                all_words.append(word)
+    stop_words = _get_stopwords() if remove_stopwords else frozenset()
     
-    return Counter(all_words)
+    return Counter(word for text in texts for word in text.split() if word not in stop_words)
 
 
 def compare_word_frequencies(texts1: list, texts2: list, top_n: int = 20, 
@@ -147,34 +154,26 @@ def compare_word_frequencies(texts1: list, texts2: list, top_n: int = 20,
     freq2 = get_word_frequencies(texts2)
     
     # Get top words from both sets combined
-    all_freq = freq1 + freq2
-    top_words = [word for word, _ in all_freq.most_common(top_n)]
-    
-    # Create comparison data
-    comparison_data = []
-    for word in top_words:
-        comparison_data.append({
-            'word': word,
-            'count1': freq1.get(word, 0),
-            'count2': freq2.get(word, 0)
-        })
+    top_words = [word for word, _ in (freq1 + freq2).most_common(top_n)]
     
-    df_comparison = pd.DataFrame(comparison_data)
+    # Counts for each set, aligned with top_words
+    counts1 = np.fromiter((freq1[word] for word in top_words), dtype=np.int64, count=len(top_words))
+    counts2 = np.fromiter((freq2[word] for word in top_words), dtype=np.int64, count=len(top_words))
     
     # Create figure
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
-        x=df_comparison['count1'],
-        y=df_comparison['word'],
+        x=counts1,
+        y=top_words,
         orientation='h',
         name='Set 1',
         marker_color='blue'
     ))
     
     fig.add_trace(go.Bar(
-        x=df_comparison['count2'],
-        y=df_comparison['word'],
+        x=counts2,
+        y=top_words,
         orientation='h',
         name='Set 2',
         marker_color='red'